@@ -1,105 +1,300 @@
-from typing import Tuple, Optional
+from typing import Tuple, Optional, Dict, List, Callable
 import math
-from board import Board
+import os
+import pickle
+from board import (Board, ONGOING, FULL_MASK, SYMMETRIES, SYMMETRY_TABLES, MOVE_ORDER,
+                   PRIORITY_TABLE, LINES_THROUGH)
+
+
+# Transposition table entry flags: the stored value is exact, a lower bound or an upper bound
+EXACT = 0
+LOWER = 1
+UPPER = 2
+
+# Shared by every TicTacToeAI: canonical (side to move, other side) key ->
+# (value, flag, best move as a canonical cell bit).
+# Negamax values do not depend on the symbols or the game, so entries carry over between
+# moves and between games.
+_transposition_table: Dict[int, Tuple[float, int, int]] = {}
+
+# INVERSE_SYMMETRY_TABLES[s] undoes SYMMETRY_TABLES[s]
+INVERSE_SYMMETRY_TABLES = tuple(
+    next(inverse for inverse in SYMMETRY_TABLES
+         if all(inverse[table[1 << cell_index]] == 1 << cell_index for cell_index in range(9)))
+    for table in SYMMETRY_TABLES
+)
+
+# Cell bit for each bit position of a PRIORITY_TABLE bitboard
+PRIORITY_CELL_BITS = tuple(1 << cell_index for cell_index in MOVE_ORDER)
+PRIORITY_LINES = tuple(LINES_THROUGH[cell_index] for cell_index in MOVE_ORDER)
+
+# Best move for every reachable 3x3 position up to symmetry: (key from Board.canonical_form(),
+# ai_is_x) -> cell index in the canonical orientation. The cache file records POLICY_VERSION
+# so a table in an older layout is rebuilt rather than misread.
+POLICY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'policy.pkl')
+POLICY_VERSION = 2
+_policy: Optional[Dict[Tuple[int, bool], int]] = None
+
+# ai_core.best_move_nb when Numba is installed, else None; see load_search_kernel
+_search_kernel: Optional[Callable[[int, int, bool], int]] = None
+_search_kernel_loaded = False
+
+
+def load_policy() -> Dict[Tuple[int, bool], int]:
+    global _policy
+    if _policy is None:
+        try:
+            with open(POLICY_PATH, 'rb') as policy_file:
+                cached_version, cached_policy = pickle.load(policy_file)
+            if cached_version == POLICY_VERSION:
+                _policy = cached_policy
+        except (OSError, EOFError, pickle.UnpicklingError, ValueError, TypeError):
+            pass
+
+    if _policy is None:
+        # First run: search every position once and cache the result next to the module
+        _policy = build_policy()
+        try:
+            with open(POLICY_PATH, 'wb') as policy_file:
+                pickle.dump((POLICY_VERSION, _policy), policy_file, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass
+    return _policy
+
+
+def load_search_kernel() -> Optional[Callable[[int, int, bool], int]]:
+    # Imports (and JIT-warms) the compiled kernel on first use only: with the policy table
+    # in place no position is ever searched, so most runs never pay for numpy and Numba
+    global _search_kernel, _search_kernel_loaded
+    if not _search_kernel_loaded:
+        from ai_core import NUMBA_AVAILABLE, best_move_nb
+        _search_kernel = best_move_nb if NUMBA_AVAILABLE else None
+        _search_kernel_loaded = True
+    return _search_kernel
+
+
+def build_policy() -> Dict[Tuple[int, bool], int]:
+    policy: Dict[Tuple[int, bool], int] = {}
+    # The Python search builds the whole table in about 0.1 s, less than Numba takes just to
+    # load and warm its kernel, so the kernel is left out here
+    searchers = {
+        'X': TicTacToeAI('X', 'O', use_policy=False, use_kernel=False),
+        'O': TicTacToeAI('O', 'X', use_policy=False, use_kernel=False),
+    }
+
+    def visit(board: Board, symbol_to_move: str) -> None:
+        canonical_key, symmetry = board.canonical_form()
+        policy_key = (canonical_key, symbol_to_move == 'X')
+        if policy_key in policy or board.terminal_state() != ONGOING:
+            return
+
+        row_index, column_index = searchers[symbol_to_move].get_best_move(board)
+        policy[policy_key] = SYMMETRIES[symmetry][row_index * 3 + column_index]
+
+        next_symbol = 'O' if symbol_to_move == 'X' else 'X'
+        for row_index, column_index in board.get_available_moves():
+            board.make_move(row_index, column_index, symbol_to_move)
+            visit(board, next_symbol)
+            board.undo_move(row_index, column_index)
+
+    visit(Board(), 'X')
+    return policy
+
+
+def find_winning_cell(side_bb: int, occupied: int) -> int:
+    # Cell index that completes a line for side_bb, or -1 if there is none
+    for cell_index in MOVE_ORDER:
+        cell_bit = 1 << cell_index
+        if occupied & cell_bit:
+            continue
+        extended_bb = side_bb | cell_bit
+        for win_mask in LINES_THROUGH[cell_index]:
+            if extended_bb & win_mask == win_mask:
+                return cell_index
+    return -1
 
 
 class TicTacToeAI:
 
-    
-    def __init__(self, ai_symbol: str, opponent_symbol: str):
+    __slots__ = ('ai_symbol', 'opponent_symbol', '_ai_is_x', '_tt', '_frame_pool', '_policy',
+                 '_use_kernel')
+
+    def __init__(self, ai_symbol: str, opponent_symbol: str, use_policy: bool = True,
+                 use_kernel: bool = True):
         self.ai_symbol: str = ai_symbol
         self.opponent_symbol: str = opponent_symbol
-    
+        self._ai_is_x: bool = ai_symbol == 'X'
+        self._tt: Dict[int, Tuple[float, int, int]] = _transposition_table
+        # One search frame per ply; see negamax
+        self._frame_pool: List[list] = [[None] * 12 for _ in range(10)]
+        self._policy: Optional[Dict[Tuple[int, bool], int]] = load_policy() if use_policy else None
+        self._use_kernel: bool = use_kernel
+
     def get_best_move(self, board: Board):
-        
+
         available_cell_positions = board.get_available_moves()
-        
+
         if not available_cell_positions:
             return None
-        
+
         if len(available_cell_positions) == 9:
             return (1, 1)
-        
-
-        highest_score = -math.inf
-        optimal_move_position = None
-        
-
-        for row_index, column_index in available_cell_positions:
-            
-            simulated_board = board.copy()
-            simulated_board.make_move(row_index, column_index, self.ai_symbol)
-            
-            move_score = self.minimax(
-                board=simulated_board,
-                is_maximizing_player=False,
-                best_maximize_score=-math.inf,
-                best_minimize_score=math.inf
-            )
-            
-            if move_score > highest_score:
-                highest_score = move_score
-                optimal_move_position = (row_index, column_index)
-        
-        return optimal_move_position
-    
-    def minimax(self, board: Board, is_maximizing_player: bool, 
-                best_maximize_score: float, best_minimize_score: float) -> float:
-
-
-        game_winner = board.check_winner()
-        
-        if game_winner == self.ai_symbol:
-            return 1 
-        
-        elif game_winner == self.opponent_symbol:
-            return -1  
-        
-        elif board.is_full():
-            return 0
-        
-        available_cell_positions = board.get_available_moves()
-        
-        if is_maximizing_player:
-            maximum_evaluation = -math.inf
-            
-            for row_index, column_index in available_cell_positions:
-                simulated_board = board.copy()
-                simulated_board.make_move(row_index, column_index, self.ai_symbol)
-                
-                evaluation_score = self.minimax(
-                    board=simulated_board,
-                    is_maximizing_player=False,
-                    best_maximize_score=best_maximize_score,
-                    best_minimize_score=best_minimize_score
-                )
-                
-                maximum_evaluation = max(maximum_evaluation, evaluation_score)
-                best_maximize_score = max(best_maximize_score, evaluation_score)
-                
-                if best_minimize_score <= best_maximize_score:
-                    break  
-            return maximum_evaluation
-        
+
+        if self._policy is not None and board.board_size == 3:
+            canonical_key, symmetry = board.canonical_form()
+            canonical_cell = self._policy.get((canonical_key, self._ai_is_x))
+            if canonical_cell is not None:
+                # Map the move from the canonical orientation back onto this board
+                best_cell_bit = INVERSE_SYMMETRY_TABLES[symmetry][1 << canonical_cell]
+                return divmod(best_cell_bit.bit_length() - 1, 3)
+
+        # Tactical shortcut: take an immediate win, otherwise block the opponent's
+        if self._ai_is_x:
+            ai_bb, opponent_bb = board.x_bb, board.o_bb
         else:
-            minimum_evaluation = math.inf
-            
-            for row_index, column_index in available_cell_positions:
-                simulated_board = board.copy()
-                simulated_board.make_move(row_index, column_index, self.opponent_symbol)
-                
-                evaluation_score = self.minimax(
-                    board=simulated_board,
-                    is_maximizing_player=True,
-                    best_maximize_score=best_maximize_score,
-                    best_minimize_score=best_minimize_score
+            ai_bb, opponent_bb = board.o_bb, board.x_bb
+        occupied = board.occupancy
+
+        forced_cell = find_winning_cell(ai_bb, occupied)
+        if forced_cell < 0:
+            forced_cell = find_winning_cell(opponent_bb, occupied)
+        if forced_cell >= 0:
+            return divmod(forced_cell, 3)
+
+        search_kernel = load_search_kernel() if self._use_kernel else None
+        if search_kernel is not None:
+            # The compiled kernel searches the raw bitboards; its result is a cell index
+            return divmod(search_kernel(board.x_bb, board.o_bb, self._ai_is_x), 3)
+
+
+        empty_bb = PRIORITY_TABLE[~occupied & FULL_MASK]
+        candidate_moves = board.get_symmetric_moves()
+
+        # Aspiration windows: scores are only -1, 0 or +1, so first ask whether any move
+        # wins (window 0..1) and only then whether any move draws (window -1..0)
+        for window_alpha, window_beta in ((0, 1), (-1, 0)):
+            for row_index, column_index in candidate_moves:
+                move_bit = 1 << (row_index * 3 + column_index)
+
+                # Negamax scores are from the side to move, i.e. the opponent after our move
+                move_score = -self.negamax(
+                    us_bb=opponent_bb,
+                    them_bb=ai_bb | move_bit,
+                    empty_bb=empty_bb ^ PRIORITY_TABLE[move_bit],
+                    last_cell=row_index * 3 + column_index,
+                    alpha=-window_beta,
+                    beta=-window_alpha
                 )
-                
-                minimum_evaluation = min(minimum_evaluation, evaluation_score)
-                
-                best_minimize_score = min(best_minimize_score, evaluation_score)
-                if best_minimize_score <= best_maximize_score:
-                    break 
-            
-            return minimum_evaluation
-        
+
+                if move_score >= window_beta:
+                    return (row_index, column_index)
+
+        # Every move loses against perfect play
+        return candidate_moves[0]
+
+    def negamax(self, us_bb: int, them_bb: int, empty_bb: int, alpha: float, beta: float,
+                last_cell: int) -> float:
+        # Score of the position for the side to move (us_bb): +1 win, -1 loss, 0 draw.
+        # empty_bb holds the empty cells in PRIORITY_TABLE order and is passed down rather
+        # than recomputed. Only the move just played by them_bb on last_cell can have
+        # completed a line, so only the lines through that cell are tested.
+        #
+        # The search runs on an explicit stack of reused frames instead of recursing, one
+        # frame per expanded node: [us_bb, them_bb, empty_bb, alpha, beta, original_alpha,
+        # best_evaluation, remaining_cells, tt_key, symmetry, searched_bit, best_move_bit];
+        # the two move bits are in PRIORITY_TABLE order
+        transposition_table = self._tt
+        frames = self._frame_pool
+        depth = 0
+        last_move_lines = LINES_THROUGH[last_cell]
+
+        while True:
+            # Evaluate the current node directly if it is terminal or settled by the table
+            node_value: Optional[float] = None
+            for win_mask in last_move_lines:
+                if them_bb & win_mask == win_mask:
+                    node_value = -1
+                    break
+
+            if node_value is None and not empty_bb:
+                node_value = 0
+
+            tt_move_bit = 0
+            if node_value is None:
+                # The value only depends on whose stones are whose, not on the symbols or the
+                # depth, so entries stay valid across get_best_move calls
+                symmetric_keys = [table[us_bb] | table[them_bb] << 9 for table in SYMMETRY_TABLES]
+                tt_key = min(symmetric_keys)
+                symmetry = symmetric_keys.index(tt_key)
+                tt_entry = transposition_table.get(tt_key)
+                if tt_entry is not None:
+                    stored_value, stored_flag, canonical_move_bit = tt_entry
+                    if stored_flag == EXACT:
+                        node_value = stored_value
+                    else:
+                        if stored_flag == LOWER:
+                            alpha = max(alpha, stored_value)
+                        else:
+                            beta = min(beta, stored_value)
+                        if alpha >= beta:
+                            node_value = stored_value
+                    # The stored best move is a cell bit in the canonical orientation
+                    tt_move_bit = PRIORITY_TABLE[INVERSE_SYMMETRY_TABLES[symmetry][canonical_move_bit]]
+
+            if node_value is None:
+                # Expand the node and descend into its first child: the best move from an
+                # earlier search of this position if there is one, else the first in move order
+                first_bit = tt_move_bit or empty_bb & -empty_bb
+                move_priority = first_bit.bit_length() - 1
+                frame = frames[depth]
+                frame[:] = (us_bb, them_bb, empty_bb, alpha, beta, alpha, -math.inf,
+                            empty_bb ^ first_bit, tt_key, symmetry, first_bit, first_bit)
+                depth += 1
+                us_bb, them_bb, empty_bb, alpha, beta = (
+                    them_bb, us_bb | PRIORITY_CELL_BITS[move_priority],
+                    empty_bb ^ first_bit, -beta, -alpha)
+                last_move_lines = PRIORITY_LINES[move_priority]
+                continue
+
+            # Hand the value back up until a parent still has a child left to search
+            while depth:
+                frame = frames[depth - 1]
+                (parent_us_bb, parent_them_bb, parent_empty_bb, parent_alpha, parent_beta,
+                 original_alpha, best_evaluation, remaining_cells, parent_tt_key, parent_symmetry,
+                 searched_bit, best_move_bit) = frame
+
+                evaluation_score = -node_value
+                if evaluation_score > best_evaluation:
+                    best_evaluation = evaluation_score
+                    best_move_bit = searched_bit
+                if evaluation_score > parent_alpha:
+                    parent_alpha = evaluation_score
+
+                if parent_alpha < parent_beta and remaining_cells:
+                    lowest_bit = remaining_cells & -remaining_cells
+                    move_priority = lowest_bit.bit_length() - 1
+                    frame[3] = parent_alpha
+                    frame[6] = best_evaluation
+                    frame[7] = remaining_cells ^ lowest_bit
+                    frame[10] = lowest_bit
+                    frame[11] = best_move_bit
+                    us_bb, them_bb, empty_bb, alpha, beta = (
+                        parent_them_bb, parent_us_bb | PRIORITY_CELL_BITS[move_priority],
+                        parent_empty_bb ^ lowest_bit, -parent_beta, -parent_alpha)
+                    last_move_lines = PRIORITY_LINES[move_priority]
+                    break
+
+                if best_evaluation <= original_alpha:
+                    tt_flag = UPPER
+                elif best_evaluation >= parent_beta:
+                    tt_flag = LOWER
+                else:
+                    tt_flag = EXACT
+                canonical_move_bit = SYMMETRY_TABLES[parent_symmetry][
+                    PRIORITY_CELL_BITS[best_move_bit.bit_length() - 1]]
+                transposition_table[parent_tt_key] = (best_evaluation, tt_flag, canonical_move_bit)
+
+                node_value = best_evaluation
+                depth -= 1
+            else:
+                return node_value
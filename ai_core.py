@@ -0,0 +1,123 @@
+
+from board import WIN_MASKS, MOVE_ORDER, FULL_MASK
+
+# Only imported by ai.load_search_kernel, when a position actually has to be searched; numpy
+# and Numba are slow to import, and with the policy table most runs never search at all
+try:
+    from numba import njit  # type: ignore[import-not-found]
+except ImportError:  # Numba is optional; without it the AI uses its pure Python search
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):  # type: ignore[no-redef]
+        def decorator(function):
+            return function
+        return decorator
+else:
+    import numpy as np
+    NUMBA_AVAILABLE = True
+
+
+# Columns of a negamax_nb search frame
+_US, _THEM, _EMPTY, _ALPHA, _BETA, _BEST, _REMAINING = range(7)
+
+
+@njit(cache=True, nogil=True)
+def first_cell_bit_nb(cells_bb: int) -> int:
+    # Bit of the first cell of cells_bb in move order (cells_bb must not be empty)
+    for cell_index in MOVE_ORDER:
+        cell_bit = 1 << cell_index
+        if cells_bb & cell_bit:
+            return cell_bit
+    return 0
+
+
+@njit(cache=True, nogil=True)
+def negamax_nb(us_bb: int, them_bb: int, empty_bb: int, alpha: int, beta: int) -> int:
+    # Same scoring as TicTacToeAI.negamax: +1 win, -1 loss, 0 draw for the side to move.
+    # Runs on an explicit frame stack; Numba cannot load recursive functions from its
+    # on-disk cache.
+    frames = np.empty((10, 7), dtype=np.int64)
+    depth = 0
+
+    while True:
+        node_value = 2  # Not settled yet
+        for win_mask in WIN_MASKS:
+            if them_bb & win_mask == win_mask:
+                node_value = -1
+                break
+        if node_value == 2 and empty_bb == 0:
+            node_value = 0
+
+        if node_value == 2:
+            # Expand the node and descend into its first child
+            cell_bit = first_cell_bit_nb(empty_bb)
+            frames[depth, _US] = us_bb
+            frames[depth, _THEM] = them_bb
+            frames[depth, _EMPTY] = empty_bb
+            frames[depth, _ALPHA] = alpha
+            frames[depth, _BETA] = beta
+            frames[depth, _BEST] = -2
+            frames[depth, _REMAINING] = empty_bb ^ cell_bit
+            depth += 1
+            us_bb, them_bb, empty_bb, alpha, beta = (
+                them_bb, us_bb | cell_bit, empty_bb ^ cell_bit, -beta, -alpha)
+            continue
+
+        # Hand the value back up until a parent still has a child left to search
+        descended = False
+        while depth > 0:
+            frame = depth - 1
+            score = -node_value
+            if score > frames[frame, _BEST]:
+                frames[frame, _BEST] = score
+            if score > frames[frame, _ALPHA]:
+                frames[frame, _ALPHA] = score
+
+            remaining_cells = frames[frame, _REMAINING]
+            if frames[frame, _ALPHA] < frames[frame, _BETA] and remaining_cells != 0:
+                cell_bit = first_cell_bit_nb(remaining_cells)
+                frames[frame, _REMAINING] = remaining_cells ^ cell_bit
+                us_bb = frames[frame, _THEM]
+                them_bb = frames[frame, _US] | cell_bit
+                empty_bb = frames[frame, _EMPTY] ^ cell_bit
+                alpha = -frames[frame, _BETA]
+                beta = -frames[frame, _ALPHA]
+                descended = True
+                break
+
+            node_value = frames[frame, _BEST]
+            depth -= 1
+
+        if not descended:
+            return node_value
+
+
+@njit(cache=True, nogil=True)
+def best_move_nb(x_bb: int, o_bb: int, ai_is_x: bool) -> int:
+    # Returns the cell index of the best move for the AI, or -1 if the board is full.
+    # Uses the same win-then-draw aspiration windows as TicTacToeAI.get_best_move.
+    ai_bb = x_bb if ai_is_x else o_bb
+    opponent_bb = o_bb if ai_is_x else x_bb
+    empty_bb = ~(x_bb | o_bb) & FULL_MASK
+    first_cell = -1
+
+    for window_alpha, window_beta in ((0, 1), (-1, 0)):
+        for cell_index in MOVE_ORDER:
+            cell_bit = 1 << cell_index
+            if not empty_bb & cell_bit:
+                continue
+            if first_cell < 0:
+                first_cell = cell_index
+
+            score = -negamax_nb(opponent_bb, ai_bb | cell_bit, empty_bb ^ cell_bit,
+                                -window_beta, -window_alpha)
+            if score >= window_beta:
+                return cell_index
+
+    # Every move loses against perfect play
+    return first_cell
+
+
+if NUMBA_AVAILABLE:
+    # Compile (or load from cache) now so the first search does not pay for the JIT
+    best_move_nb(0b000010000, 0, False)
@@ -1,84 +1,215 @@
 
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Iterator
+
+
+# Cells are numbered 0..8 row by row; cell (row, col) is bit row * 3 + col.
+FULL_MASK = 0x1FF
+
+WIN_MASKS = (
+    0b000000111, 0b000111000, 0b111000000,  # rows
+    0b001001001, 0b010010010, 0b100100100,  # columns
+    0b100010001, 0b001010100,               # diagonals
+)
+
+# LINES_THROUGH[cell] holds the winning lines containing that cell (2 to 4 of them)
+LINES_THROUGH = tuple(
+    tuple(win_mask for win_mask in WIN_MASKS if win_mask & (1 << cell_index))
+    for cell_index in range(9)
+)
+
+# Cell contents as small ints, and the display symbol for each
+EMPTY = 0
+X = 1
+O = 2
+PIECE_SYMBOLS = (None, 'X', 'O')
+
+# Cells in search order: center first, then corners, then edges
+MOVE_ORDER = (4, 0, 2, 6, 8, 1, 3, 5, 7)
+CELL_TO_POSITION = tuple(divmod(cell_index, 3) for cell_index in range(9))
+
+# PRIORITY_TABLE[bb] reorders the bits of bb so that bit k is cell MOVE_ORDER[k]; scanning
+# it lowest bit first visits the cells of bb in move order
+PRIORITY_TABLE = tuple(
+    sum(1 << priority for priority, cell_index in enumerate(MOVE_ORDER) if (bb >> cell_index) & 1)
+    for bb in range(FULL_MASK + 1)
+)
+
+# The 8 symmetries of the square as cell permutations: cell i moves to SYMMETRIES[s][i]
+SYMMETRIES = tuple(
+    tuple(new_row * 3 + new_col for new_row, new_col in (transform(row, col) for row, col in CELL_TO_POSITION))
+    for transform in (
+        lambda row, col: (row, col),
+        lambda row, col: (col, 2 - row),
+        lambda row, col: (2 - row, 2 - col),
+        lambda row, col: (2 - col, row),
+        lambda row, col: (row, 2 - col),
+        lambda row, col: (2 - row, col),
+        lambda row, col: (col, row),
+        lambda row, col: (2 - col, 2 - row),
+    )
+)
+
+# SYMMETRY_TABLES[s][bb] is bitboard bb with symmetry s applied
+SYMMETRY_TABLES = tuple(
+    tuple(sum(1 << permutation[cell_index] for cell_index in range(9) if (bb >> cell_index) & 1)
+          for bb in range(FULL_MASK + 1))
+    for permutation in SYMMETRIES
+)
+
+# Results of Board.terminal_state()
+ONGOING = 0
+X_WON = 1
+O_WON = 2
+DRAW = 3
 
 
 class Board:
 
-    
-    def __init__(self):
-        self.grid: List[List[Optional[str]]] = [[None for _ in range(3)] for _ in range(3)]
+    __slots__ = ('x_bb', 'o_bb', 'occupancy', 'board_size')
+
+    def __init__(self) -> None:
+        self.x_bb: int = 0
+        self.o_bb: int = 0
+        self.occupancy: int = 0  # x_bb | o_bb, kept up to date by make_move and undo_move
         self.board_size: int = 3  # Standard Tic-Tac-Toe is 3x3
-    
+
     def make_move(self, row: int, col: int, player_symbol: str) -> bool:
 
         if self.is_valid_move(row, col):
-            self.grid[row][col] = player_symbol
+            cell_index = row * 3 + col
+            self.occupancy |= 1 << cell_index
+            if player_symbol == 'X':
+                self.x_bb |= 1 << cell_index
+            else:
+                self.o_bb |= 1 << cell_index
             return True
         return False
-    
+
+    def undo_move(self, row: int, col: int) -> None:
+        cell_index = row * 3 + col
+        cell_bit = 1 << cell_index
+        if self.x_bb & cell_bit:
+            self.x_bb &= ~cell_bit
+        elif self.o_bb & cell_bit:
+            self.o_bb &= ~cell_bit
+        else:
+            return
+        self.occupancy &= ~cell_bit
+
     def is_valid_move(self, row: int, col: int) -> bool:
 
         if not (0 <= row < self.board_size and 0 <= col < self.board_size):
             return False
-    
-        return self.grid[row][col] is None
-    
+
+        return not (self.occupancy >> (row * 3 + col)) & 1
+
     def check_winner(self) -> Optional[str]:
-        for row_cells in self.grid:
-            if row_cells[0] == row_cells[1] == row_cells[2] and row_cells[0] is not None:
-                return row_cells[0]  # Return the winning symbol
-        
-        for column_index in range(self.board_size):
-            if (self.grid[0][column_index] == self.grid[1][column_index] == self.grid[2][column_index] 
-                and self.grid[0][column_index] is not None):
-                return self.grid[0][column_index]  # Return the winning symbol
-        
-        if (self.grid[0][0] == self.grid[1][1] == self.grid[2][2] 
-            and self.grid[0][0] is not None):
-            return self.grid[0][0]  # Return the winning symbol
-        
-        if (self.grid[0][2] == self.grid[1][1] == self.grid[2][0] 
-            and self.grid[0][2] is not None):
-            return self.grid[0][2]  # Return the winning symbol
-        
+        x_bb = self.x_bb
+        o_bb = self.o_bb
+        for win_mask in WIN_MASKS:
+            if x_bb & win_mask == win_mask:
+                return 'X'  # Return the winning symbol
+            if o_bb & win_mask == win_mask:
+                return 'O'
+
         # No winner found
         return None
-    
+
+    def check_winner_after(self, row: int, col: int) -> bool:
+        # Whether the piece on (row, col) completes a line; only lines through it can
+        cell_index = row * 3 + col
+        side_bb = self.x_bb if (self.x_bb >> cell_index) & 1 else self.o_bb
+        for win_mask in LINES_THROUGH[cell_index]:
+            if side_bb & win_mask == win_mask:
+                return True
+        return False
+
+    def terminal_state(self) -> int:
+        # One pass for both the win and the draw test, returned as a small int for the search
+        x_bb = self.x_bb
+        o_bb = self.o_bb
+        for win_mask in WIN_MASKS:
+            if x_bb & win_mask == win_mask:
+                return X_WON
+            if o_bb & win_mask == win_mask:
+                return O_WON
+
+        if self.occupancy == FULL_MASK:
+            return DRAW
+        return ONGOING
+
+    def canonical_form(self) -> Tuple[int, int]:
+        # Both bitboards packed into one int, minimized over all symmetries so that rotated
+        # and mirrored positions share a key, plus the index of a symmetry in SYMMETRIES
+        # that maps this position onto the canonical one
+        x_bb = self.x_bb
+        o_bb = self.o_bb
+        symmetric_keys = [table[x_bb] | table[o_bb] << 9 for table in SYMMETRY_TABLES]
+        canonical_key = min(symmetric_keys)
+        return canonical_key, symmetric_keys.index(canonical_key)
+
+    def get_symmetric_moves(self) -> List[Tuple[int, int]]:
+        # Available moves with at most one move per class of moves that are equivalent
+        # under the symmetries leaving the current position unchanged
+        x_bb = self.x_bb
+        o_bb = self.o_bb
+        stabilizer = [table for table in SYMMETRY_TABLES
+                      if table[x_bb] == x_bb and table[o_bb] == o_bb]
+
+        distinct_moves = []
+        seen_move_bits = set()
+        for row, col in self.get_available_moves():
+            move_bit = 1 << (row * 3 + col)
+            representative = min(table[move_bit] for table in stabilizer)
+            if representative not in seen_move_bits:
+                seen_move_bits.add(representative)
+                distinct_moves.append((row, col))
+        return distinct_moves
+
     def is_full(self) -> bool:
-        return all(cell_value is not None 
-                   for row_cells in self.grid 
-                   for cell_value in row_cells)
-    
+        return self.occupancy == FULL_MASK
+
     def is_draw(self) -> bool:
         return self.is_full() and self.check_winner() is None
-    
+
+    def empty_bits(self) -> Iterator[int]:
+        # Indices of the empty cells in move order, one iteration per empty cell
+        empty_cells = PRIORITY_TABLE[~self.occupancy & FULL_MASK]
+        while empty_cells:
+            lowest_bit = empty_cells & -empty_cells
+            empty_cells ^= lowest_bit
+            yield MOVE_ORDER[lowest_bit.bit_length() - 1]
+
     def get_available_moves(self) -> List[Tuple[int, int]]:
-        empty_cell_positions = []
-        
-        for row_index in range(self.board_size):
-            for column_index in range(self.board_size):
-                if self.grid[row_index][column_index] is None:
-                    empty_cell_positions.append((row_index, column_index))
-        
-        return empty_cell_positions
-    
-    def get_cell(self, row: int, col: int) -> Optional[str]:
+        return [CELL_TO_POSITION[cell_index] for cell_index in self.empty_bits()]
+
+    def get_piece(self, row: int, col: int) -> int:
         if 0 <= row < self.board_size and 0 <= col < self.board_size:
-            return self.grid[row][col]
-        return None
-    
+            cell_bit = 1 << (row * 3 + col)
+            return X if self.x_bb & cell_bit else O if self.o_bb & cell_bit else EMPTY
+        return EMPTY
+
+    def get_cell(self, row: int, col: int) -> Optional[str]:
+        return PIECE_SYMBOLS[self.get_piece(row, col)]
+
     def reset(self) -> None:
-        self.grid = [[None for _ in range(3)] for _ in range(3)]
-    
+        self.x_bb = 0
+        self.o_bb = 0
+        self.occupancy = 0
+
     def copy(self) -> 'Board':
-        copied_board = Board()
-        copied_board.grid = [row_cells[:] for row_cells in self.grid]
+        copied_board = Board.__new__(Board)
+        copied_board.x_bb = self.x_bb
+        copied_board.o_bb = self.o_bb
+        copied_board.occupancy = self.occupancy
+        copied_board.board_size = self.board_size
         return copied_board
-    
+
     def __str__(self) -> str:
         text_lines = []
-        for row_cells in self.grid:
-            row_text = " | ".join(cell_value if cell_value else " " for cell_value in row_cells)
+        for row_index in range(self.board_size):
+            row_text = " | ".join(PIECE_SYMBOLS[self.get_piece(row_index, column_index)] or " "
+                                  for column_index in range(self.board_size))
             text_lines.append(row_text)
-        
+
         return "\n" + ("-" * 9 + "\n").join(text_lines)
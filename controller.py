@@ -1,9 +1,9 @@
 
 
-from typing import Optional, Callable
+from typing import Optional, Callable, Tuple
 from board import Board
-from player import Player, PlayerType
-from ai import TicTacToeAI
+from player import Player
+from ai import TicTacToeAI, load_policy
 
 
 class GameController:
@@ -17,9 +17,13 @@ class GameController:
         self.ai_opponent: Optional[TicTacToeAI] = None
         self.is_game_active: bool = False
         
-        # Callback functions to notify UI of game events
+        # Callback functions to notify UI of game events; moves are reported as
+        # (cell index row * 3 + col, symbol)
         self.move_made_callback: Optional[Callable] = None
         self.game_ended_callback: Optional[Callable] = None
+        
+        # Load (or build once) the precomputed move table now, so no AI turn waits for it
+        load_policy()
     
     def start_new_game(self, chosen_symbol_for_human: str) -> None:
 
@@ -27,8 +31,8 @@ class GameController:
         
         computer_symbol = 'O' if chosen_symbol_for_human == 'X' else 'X'
         
-        self.human_player = Player(chosen_symbol_for_human, PlayerType.HUMAN)
-        self.computer_player = Player(computer_symbol, PlayerType.AI)
+        self.human_player = Player(chosen_symbol_for_human, is_ai=False)
+        self.computer_player = Player(computer_symbol, is_ai=True)
         
         self.ai_opponent = TicTacToeAI(computer_symbol, chosen_symbol_for_human)
         
@@ -39,7 +43,7 @@ class GameController:
         
         self.is_game_active = True
         
-        if self.current_turn_player.is_ai():
+        if self.current_turn_player.is_ai:
             self._make_ai_move()
     
     def make_human_move(self, row: int, col: int) -> bool:
@@ -47,7 +51,7 @@ class GameController:
         if not self.is_game_active:
             return False
         
-        if not self.current_turn_player or not self.current_turn_player.is_human():
+        if not self.current_turn_player or self.current_turn_player.is_ai:
             return False
         
         if not self.game_board.is_valid_move(row, col):
@@ -56,9 +60,9 @@ class GameController:
         self.game_board.make_move(row, col, self.current_turn_player.symbol)
         
         if self.move_made_callback:
-            self.move_made_callback(row, col, self.current_turn_player.symbol)
+            self.move_made_callback(row * 3 + col, self.current_turn_player.symbol)
         
-        if self._check_if_game_ended():
+        if self._check_if_game_ended(row, col):
             return True
         
         self.current_turn_player = self.computer_player
@@ -72,25 +76,37 @@ class GameController:
         best_move_position = self.ai_opponent.get_best_move(self.game_board)
         
         if best_move_position:
-            row_index, column_index = best_move_position
-            
-            self.game_board.make_move(row_index, column_index, self.computer_player.symbol)
-            
-            if self.move_made_callback:
-                self.move_made_callback(row_index, column_index, self.computer_player.symbol)
-            
-            if self._check_if_game_ended():
-                return
-            
-            self.current_turn_player = self.human_player
+            self.play_ai_move(*best_move_position)
+    
+    def prepare_ai_search(self) -> Callable[[], Optional[Tuple[int, int]]]:
+        # For searching off the controller's thread: the returned function only touches its own
+        # copy of the board, never the controller, and its result goes back to play_ai_move
+        ai_opponent = self.ai_opponent
+        board_snapshot = self.game_board.copy()
+        return lambda: ai_opponent.get_best_move(board_snapshot)
     
-    def _check_if_game_ended(self) -> bool:
-        winning_symbol = self.game_board.check_winner()
+    def play_ai_move(self, row_index: int, column_index: int) -> None:
+        # Plays a move chosen by ai_opponent, possibly searched elsewhere (e.g. on a copy of
+        # the board in another thread); ignored unless it is still the AI's turn
+        if not self.is_game_active or self.current_turn_player is not self.computer_player:
+            return
+        
+        self.game_board.make_move(row_index, column_index, self.computer_player.symbol)
+        
+        if self.move_made_callback:
+            self.move_made_callback(row_index * 3 + column_index, self.computer_player.symbol)
         
-        if winning_symbol:
+        if self._check_if_game_ended(row_index, column_index):
+            return
+        
+        self.current_turn_player = self.human_player
+    
+    def _check_if_game_ended(self, last_row: int, last_col: int) -> bool:
+        # Only the move just played on (last_row, last_col) can have completed a line
+        if self.game_board.check_winner_after(last_row, last_col):
             self.is_game_active = False
             
-            if winning_symbol == self.human_player.symbol:
+            if self.game_board.get_cell(last_row, last_col) == self.human_player.symbol:
                 winning_player = self.human_player
             else:
                 winning_player = self.computer_player
@@ -100,7 +116,7 @@ class GameController:
             
             return True
         
-        if self.game_board.is_draw():
+        if self.game_board.is_full():
             self.is_game_active = False
             
             if self.game_ended_callback:
@@ -1,30 +1,22 @@
-from enum import Enum
-from typing import Optional
-
-
-class PlayerType(Enum):
-    HUMAN = "human"
-    AI = "ai"
+from dataclasses import dataclass
 
 
+@dataclass(frozen=True, slots=True)
 class Player:
 
-    def __init__(self, symbol: str, player_type: PlayerType, name: Optional[str] = None):
+    symbol: str
+    is_ai: bool
+    name: str = ""
+
+    def __post_init__(self):
 
-        if symbol not in ['X', 'O']:
+        if self.symbol not in ['X', 'O']:
             raise ValueError("Player symbol must be 'X' or 'O'")
         
-        self.symbol: str = symbol
-        self.player_type: PlayerType = player_type
-        self.name: str = name or (f"Player ({symbol})" if player_type == PlayerType.HUMAN 
-                                   else f"AI ({symbol})")
-    
-    def is_human(self) -> bool:
-        return self.player_type == PlayerType.HUMAN
-    
-    def is_ai(self) -> bool:
-        return self.player_type == PlayerType.AI
+        if not self.name:
+            object.__setattr__(self, 'name', f"AI ({self.symbol})" if self.is_ai
+                               else f"Player ({self.symbol})")
     
     def __str__(self) -> str:
         return self.name
-    
\ No newline at end of file
+    
@@ -0,0 +1,24 @@
+"""
+Build helper for optional ahead-of-time compilation of the game logic; not an installer.
+
+    pip install mypy
+    python setup.py build_ext --inplace
+
+compiles board.py and ai.py into C extensions with mypyc, next to the sources. The compiled
+modules are picked up automatically in place of the .py files; delete the generated .so/.pyd
+files to go back to pure Python. The game itself is run from this directory with main.py.
+"""
+
+from setuptools import setup
+
+try:
+    from mypyc.build import mypycify
+except ImportError:  # mypyc is optional; without it there is nothing to build
+    ext_modules = []
+else:
+    ext_modules = mypycify(['board.py', 'ai.py'])
+
+setup(
+    name='tic-tac-toe',
+    ext_modules=ext_modules,
+)
@@ -3,9 +3,10 @@ UI module for Tic-Tac-Toe game.
 Handles the Tkinter graphical user interface.
 """
 
+import queue
+import threading
 import tkinter as tk
-from tkinter import messagebox, simpledialog
-from typing import Optional, List
+from typing import Optional, Tuple, Dict, Callable
 from controller import GameController
 from player import Player
 
@@ -20,11 +21,50 @@ class GameUI:
     COLOR_BUTTON_HOVER = "#555555" 
     COLOR_TEXT = "#FFFFFF"
     
+    SYMBOL_COLORS = {'X': COLOR_X, 'O': COLOR_O}
+    
+    # Board canvas geometry: square cells with a gap between them
+    CELL_SIZE = 100
+    CELL_GAP = 5
+    CELL_PITCH = CELL_SIZE + CELL_GAP
+    
+    # Canvas item options applied in one itemconfigure() call: the mark drawn per symbol, the
+    # square of a played cell (no hover highlight), and every square of an empty board
+    _MARK_STYLES = {symbol: {'text': symbol, 'fill': color} for symbol, color in SYMBOL_COLORS.items()}
+    _PLAYED_CELL_STYLE = {'fill': "#1a1a1a", 'activefill': ""}
+    _EMPTY_CELL_STYLE = {'fill': COLOR_BUTTON, 'activefill': COLOR_BUTTON_HOVER}
+    
+    # Status label options while the game runs: the human's turn per symbol, and the AI's turn
+    _TURN_STATUS = {
+        symbol: {'text': f"Your Turn ({symbol})", 'fg': color}
+        for symbol, color in SYMBOL_COLORS.items()
+    }
+    _AI_TURN_STATUS = {'text': "AI is thinking...", 'fg': "#FFAA00"}
+    
+    # How often the Tk thread checks for a finished AI search, in milliseconds
+    AI_POLL_INTERVAL = 10
+    
     def __init__(self, controller: GameController):
         self.controller = controller
         self.root: Optional[tk.Tk] = None
-        self.buttons: List[List[tk.Button]] = []
+        self._screen_size: Tuple[int, int] = (0, 0)
+        self.board_canvas: Optional[tk.Canvas] = None
+        # Canvas item ids indexed like the board bitboards: (row, col) is cell row * 3 + col
+        self._cell_squares: Tuple[int, ...] = ()
+        self._cell_marks: Tuple[int, ...] = ()
+        self._board_dirty = False  # Whether anything was drawn since the last reset
         self.status_label: Optional[tk.Label] = None
+        # Latest status label options not drawn yet; see _set_status
+        self._pending_status: Optional[Dict[str, str]] = None
+        # AI worker results, (game number, move), handed to the Tk thread; see _trigger_ai_move
+        self._ai_moves: queue.SimpleQueue = queue.SimpleQueue()
+        self._pending_searches = 0
+        self._game_number = 0
+        self._symbol_dialog: Optional[tk.Toplevel] = None
+        self._symbol_choice: Optional[tk.StringVar] = None
+        self._game_over_dialog: Optional[tk.Toplevel] = None
+        self._game_over_label: Optional[tk.Label] = None
+        self._game_over_yes_button: Optional[tk.Button] = None
         
         self.controller.set_move_callback(self.on_move_made)
         self.controller.set_game_over_callback(self.on_game_over)
@@ -34,30 +74,51 @@ class GameUI:
         self.root.title("Tic-Tac-Toe vs AI")
         self.root.resizable(False, False)  # Fixed size, not scalable
         self.root.configure(bg=self.COLOR_BG)
+        self._add_style_options()
         
         window_width = 450
         window_height = 550
         
-        screen_width = self.root.winfo_screenwidth()
-        screen_height = self.root.winfo_screenheight()
-        x = (screen_width // 2) - (window_width // 2)
-        y = (screen_height // 2) - (window_height // 2)
-        self.root.geometry(f'{window_width}x{window_height}+{x}+{y}')
+        # Queried once; the dialogs are centred with the same values
+        self._screen_size = (self.root.winfo_screenwidth(), self.root.winfo_screenheight())
+        self.root.geometry(self._centered_geometry(window_width, window_height))
         
         self._create_header()
         self._create_board()
         self._create_footer()
+        self._create_symbol_dialog()
+        self._create_game_over_dialog()
+    
+    def _centered_geometry(self, width: int, height: int) -> str:
+        screen_width, screen_height = self._screen_size
+        x = (screen_width // 2) - (width // 2)
+        y = (screen_height // 2) - (height // 2)
+        return f'{width}x{height}+{x}+{y}'
+    
+    def _add_style_options(self) -> None:
+        # Shared widget defaults go into the Tk option database once, before any widget
+        # is created, so the constructors below only pass what differs per widget
+        option_defaults = {
+            "*Background": self.COLOR_BG,
+            "*Foreground": self.COLOR_TEXT,
+            "*Button.background": self.COLOR_BUTTON,
+            "*Button.activeBackground": self.COLOR_BUTTON_HOVER,
+            "*Button.activeForeground": self.COLOR_TEXT,
+            "*Button.relief": tk.FLAT,
+            "*Button.borderWidth": 0,
+            "*Canvas.highlightThickness": 0,
+        }
+        for option_pattern, value in option_defaults.items():
+            self.root.option_add(option_pattern, value)
     
     def _create_header(self) -> None:
-        header_frame = tk.Frame(self.root, bg=self.COLOR_BG)
+        header_frame = tk.Frame(self.root)
         header_frame.pack(pady=20)
         
         title_label = tk.Label(
             header_frame,
             text="TIC-TAC-TOE",
-            font=("Arial", 28, "bold"),
-            bg=self.COLOR_BG,
-            fg=self.COLOR_TEXT
+            font=("Arial", 28, "bold")
         )
         title_label.pack()
         
@@ -65,7 +126,6 @@ class GameUI:
             header_frame,
             text="Human vs AI",
             font=("Arial", 12),
-            bg=self.COLOR_BG,
             fg="#888888"
         )
         subtitle_label.pack(pady=5)
@@ -74,51 +134,50 @@ class GameUI:
             header_frame,
             text="",
             font=("Arial", 16, "bold"),
-            bg=self.COLOR_BG,
-            fg=self.COLOR_TEXT,
             height=2
         )
         self.status_label.pack(pady=10)
     
     def _create_board(self) -> None:
-        """Create the 3x3 grid of square buttons (fixed size, centered)."""
-        board_frame = tk.Frame(self.root, bg=self.COLOR_BG)
-        board_frame.pack(pady=10)
-        
-        self.buttons = []
-        
-        button_size = 100
-        
-        for row in range(3):
-            button_row = []
-            for col in range(3):
-                button = tk.Button(
-                    board_frame,
-                    text="",
-                    font=("Arial", 40, "bold"),
-                    width=button_size,
-                    height=button_size,
-                    bg=self.COLOR_BUTTON,
-                    fg=self.COLOR_TEXT,
-                    activebackground=self.COLOR_BUTTON_HOVER,
-                    activeforeground=self.COLOR_TEXT,
-                    relief=tk.FLAT,
-                    bd=0,
-                    command=lambda r=row, c=col: self.on_cell_click(r, c)
-                )
-                button.place(
-                    x=col * (button_size + 5),
-                    y=row * (button_size + 5),
-                    width=button_size,
-                    height=button_size
-                )
-                button_row.append(button)
-            self.buttons.append(button_row)
+        """Draw the 3x3 grid of square cells on one canvas (fixed size, centered)."""
+        # The canvas is packed straight into the window with its final size, so the board
+        # costs a single geometry pass and no wrapper frame
+        board_length = 3 * self.CELL_SIZE + 2 * self.CELL_GAP
+        self.board_canvas = tk.Canvas(
+            self.root,
+            width=board_length,
+            height=board_length
+        )
+        self.board_canvas.pack(pady=10)
+        
+        cell_squares = []
+        cell_marks = []
+        for cell_index in range(9):
+            row, col = divmod(cell_index, 3)
+            x = col * self.CELL_PITCH
+            y = row * self.CELL_PITCH
+            cell_squares.append(self.board_canvas.create_rectangle(
+                x, y, x + self.CELL_SIZE, y + self.CELL_SIZE,
+                width=0,
+                tags=("cell",),
+                **self._EMPTY_CELL_STYLE
+            ))
+            # Marks ignore the pointer, so hovering over one still highlights its square
+            cell_marks.append(self.board_canvas.create_text(
+                x + self.CELL_SIZE // 2, y + self.CELL_SIZE // 2,
+                text="",
+                font=("Arial", 40, "bold"),
+                state=tk.DISABLED,
+                tags=("mark",)
+            ))
+        self._cell_squares = tuple(cell_squares)
+        self._cell_marks = tuple(cell_marks)
         
-        board_frame.config(width=3 * button_size + 2 * 5, height=3 * button_size + 2 * 5)
+        # One binding for the whole board; the cell comes from the click position
+        self.board_canvas.bind("<Button-1>", self._on_board_click)
     
     def _create_footer(self) -> None:
-        footer_frame = tk.Frame(self.root, bg=self.COLOR_BG)
+        footer_frame = tk.Frame(self.root)
         footer_frame.pack(pady=25)
         
         new_game_button = tk.Button(
@@ -126,75 +185,124 @@ class GameUI:
             text="NEW GAME",
             font=("Arial", 14, "bold"),
             bg="#444444",
-            fg=self.COLOR_TEXT,
-            activebackground="#555555",
-            activeforeground=self.COLOR_TEXT,
             width=20,
             height=2,
-            relief=tk.FLAT,
-            bd=0,
             command=self.start_new_game
         )
         new_game_button.pack()
     
+    def _on_board_click(self, event: tk.Event) -> None:
+        row, row_offset = divmod(event.y, self.CELL_PITCH)
+        col, col_offset = divmod(event.x, self.CELL_PITCH)
+        # Clicks in the gaps between cells do nothing
+        if row < 3 and col < 3 and row_offset < self.CELL_SIZE and col_offset < self.CELL_SIZE:
+            self.on_cell_click(row, col)
+    
     def on_cell_click(self, row: int, col: int) -> None:
         if self.controller.is_game_active:
             success = self.controller.make_human_move(row, col)
             if success and self.controller.is_game_active:
-                self.root.after(300, self._trigger_ai_move)
+                # AI moves come from a precomputed table, so no delay is needed to hide search time
+                self.root.after_idle(self._trigger_ai_move)
     
-    def on_move_made(self, row: int, col: int, symbol: str) -> None:
-        
-        button = self.buttons[row][col]
-        button.config(
-            text=symbol,
-            state=tk.DISABLED,
-            disabledforeground=self.COLOR_X if symbol == 'X' else self.COLOR_O,
-            bg="#1a1a1a"  
-        )
+    def on_move_made(self, cell_index: int, symbol: str) -> None:
+        
+        self._board_dirty = True
+        self.board_canvas.itemconfigure(self._cell_squares[cell_index], **self._PLAYED_CELL_STYLE)
+        self.board_canvas.itemconfigure(self._cell_marks[cell_index], **self._MARK_STYLES[symbol])
         
         if self.controller.is_game_active:
             current_player = self.controller.current_turn_player
-            if current_player and current_player.is_human():
-                self.status_label.config(
-                    text=f"Your Turn ({current_player.symbol})",
-                    fg=self.COLOR_X if current_player.symbol == 'X' else self.COLOR_O
-                )
+            if current_player and not current_player.is_ai:
+                self._set_status(self._TURN_STATUS[current_player.symbol])
             else:
-                self.status_label.config(
-                    text="AI is thinking...",
-                    fg="#FFAA00"
-                )
-        
-        self.root.update()
+                self._set_status(self._AI_TURN_STATUS)
+    
+    def _set_status(self, status_options: Dict[str, str]) -> None:
+        # Several status changes can arrive in one pass of the event loop (a move and the
+        # game over that follows it); only the last one is drawn, once Tk is idle
+        if self._pending_status is None:
+            self.root.after_idle(self._flush_status)
+        self._pending_status = status_options
+    
+    def _flush_status(self) -> None:
+        self.status_label.config(**self._pending_status)
+        self._pending_status = None
     
     def _trigger_ai_move(self) -> None:
         if self.controller.is_game_active and self.controller.current_turn_player:
-            if self.controller.current_turn_player.is_ai():
-                self.controller._make_ai_move()
+            if self.controller.current_turn_player.is_ai:
+                # Search on a worker thread so the window stays responsive. The worker only
+                # runs a search over its own copy of the board; the move is played back on the
+                # Tk thread, so neither the controller nor Tk is touched from the worker.
+                worker = threading.Thread(
+                    target=self._ai_worker,
+                    args=(self._game_number, self.controller.prepare_ai_search()),
+                    daemon=True
+                )
+                worker.start()
+                
+                self._pending_searches += 1
+                if self._pending_searches == 1:
+                    self.root.after(self.AI_POLL_INTERVAL, self._poll_ai_moves)
+    
+    def _ai_worker(self, game_number: int, search: Callable[[], Optional[Tuple[int, int]]]) -> None:
+        move = None
+        try:
+            move = search()
+        finally:
+            # Report back even if the search raised, so _poll_ai_moves stops waiting for it
+            self._ai_moves.put((game_number, move))
+    
+    def _poll_ai_moves(self) -> None:
+        # Runs on the Tk thread and reschedules itself until every started search has reported
+        while True:
+            try:
+                game_number, move = self._ai_moves.get_nowait()
+            except queue.Empty:
+                break
+            self._pending_searches -= 1
+            # A move searched for a game that has since been restarted is dropped, and a
+            # search that raised reports no move
+            if game_number == self._game_number and move is not None:
+                self.controller.play_ai_move(*move)
+        
+        if self._pending_searches:
+            self.root.after(self.AI_POLL_INTERVAL, self._poll_ai_moves)
     
     def on_game_over(self, winner: Optional[Player], is_draw: bool) -> None:
 
         if is_draw:
-            self.status_label.config(text="DRAW!", fg="#FFAA00")
+            self._set_status({'text': "DRAW!", 'fg': "#FFAA00"})
             title = "Draw!"
             message = "It's a draw!\nThe game ended in a tie.\n\nPlay again?"
         else:
-            if winner.is_human():
-                self.status_label.config(text="YOU WON!", fg="#00FF00")
+            if not winner.is_ai:
+                self._set_status({'text': "YOU WON!", 'fg': "#00FF00"})
                 title = "Victory!"
                 message = f"Congratulations!\nYou won as {winner.symbol}!\n\nPlay again?"
             else:
-                self.status_label.config(text="AI WON!", fg="#FF4444")
+                self._set_status({'text': "AI WON!", 'fg': "#FF4444"})
                 title = "Defeat"
                 message = f"AI won as {winner.symbol}.\nBetter luck next time!\n\nPlay again?"
         
-        self._disable_all_buttons()
+        self._disable_all_cells()
         
         self.root.after(500, lambda: self._show_game_over_dialog(message, title))
     
     def _show_game_over_dialog(self, message: str, title: str) -> None:
-        play_again = messagebox.askyesno(title, message)
+        # Returns straight away; the dialog's buttons call _answer_game_over
+        dialog = self._game_over_dialog
+        dialog.title(title)
+        self._game_over_label.config(text=message)
+        dialog.deiconify()
+        dialog.grab_set()
+        self._game_over_yes_button.focus_set()
+    
+    def _answer_game_over(self, play_again: bool) -> None:
+        dialog = self._game_over_dialog
+        dialog.grab_release()
+        dialog.withdraw()
         
         if play_again:
             self.start_new_game()
@@ -205,74 +313,50 @@ class GameUI:
         choice = self._ask_symbol_choice()
         
         if choice:
-            self._reset_board_display()
+            self._game_number += 1
+            if self._board_dirty:
+                self._reset_board_display()
             
+            # When the AI has X the controller plays its opening move (the centre, returned
+            # without a search) inside start_new_game, so no AI turn is left to schedule
             self.controller.start_new_game(choice)
             
-            if self.controller.current_turn_player and self.controller.current_turn_player.is_human():
-                self.status_label.config(
-                    text=f"Your Turn (X)",
-                    fg=self.COLOR_X
-                )
-            else:
-                self.status_label.config(
-                    text="AI goes first...",
-                    fg=self.COLOR_O
-                )
-                self.root.after(500, self._trigger_ai_move)
+            self._set_status(self._TURN_STATUS[self.controller.human_player.symbol])
     
-    def _ask_symbol_choice(self) -> Optional[str]:
-
+    def _create_symbol_dialog(self) -> None:
+        # Built once and hidden; _ask_symbol_choice shows it again for every new game
         dialog = tk.Toplevel(self.root)
+        dialog.withdraw()
         dialog.title("Choose Your Symbol")
-        dialog.geometry("400x250")
         dialog.resizable(False, False)
-        dialog.configure(bg=self.COLOR_BG)
         dialog.transient(self.root)
-        dialog.grab_set()
         
-        dialog.update_idletasks()
-        screen_width = dialog.winfo_screenwidth()
-        screen_height = dialog.winfo_screenheight()
-        x = (screen_width // 2) - 200
-        y = (screen_height // 2) - 125
-        dialog.geometry(f'+{x}+{y}')
+        dialog.geometry(self._centered_geometry(400, 250))
         
-        result = [None]
+        # Set to 'X' or 'O' by the buttons, or to "" when the dialog is closed
+        self._symbol_choice = tk.StringVar(dialog)
+        dialog.protocol("WM_DELETE_WINDOW", lambda: self._symbol_choice.set(""))
+        dialog.bind("<Destroy>", self._on_symbol_dialog_destroyed)
         
         label = tk.Label(
             dialog,
             text="Choose your symbol:",
-            font=("Arial", 16, "bold"),
-            bg=self.COLOR_BG,
-            fg=self.COLOR_TEXT
+            font=("Arial", 16, "bold")
         )
         label.pack(pady=30)
         
-        button_frame = tk.Frame(dialog, bg=self.COLOR_BG)
+        button_frame = tk.Frame(dialog)
         button_frame.pack(pady=20)
         
-        def choose_x():
-            result[0] = 'X'
-            dialog.destroy()
-        
-        def choose_o():
-            result[0] = 'O'
-            dialog.destroy()
-        
         x_button = tk.Button(
             button_frame,
             text="X\n(Go First)",
             font=("Arial", 18, "bold"),
-            bg=self.COLOR_BUTTON,
             fg=self.COLOR_X,
-            activebackground=self.COLOR_BUTTON_HOVER,
             activeforeground=self.COLOR_X,
             width=10,
             height=3,
-            relief=tk.FLAT,
-            bd=0,
-            command=choose_x
+            command=lambda: self._symbol_choice.set('X')
         )
         x_button.pack(side=tk.LEFT, padx=15)
         
@@ -280,15 +364,11 @@ class GameUI:
             button_frame,
             text="O\n(Go Second)",
             font=("Arial", 18, "bold"),
-            bg=self.COLOR_BUTTON,
             fg=self.COLOR_O,
-            activebackground=self.COLOR_BUTTON_HOVER,
             activeforeground=self.COLOR_O,
             width=10,
             height=3,
-            relief=tk.FLAT,
-            bd=0,
-            command=choose_o
+            command=lambda: self._symbol_choice.set('O')
         )
         o_button.pack(side=tk.LEFT, padx=15)
         
@@ -296,28 +376,84 @@ class GameUI:
             dialog,
             text="X always makes the first move",
             font=("Arial", 10),
-            bg=self.COLOR_BG,
             fg="#888888"
         )
         info_label.pack(pady=15)
         
-        self.root.wait_window(dialog)
-        return result[0]
+        self._symbol_dialog = dialog
+    
+    def _on_symbol_dialog_destroyed(self, event: tk.Event) -> None:
+        # Closing the main window destroys the dialog along with it. tkwait variable does not
+        # notice that, so write the variable to end the wait in _ask_symbol_choice.
+        if event.widget is self._symbol_dialog:
+            self._symbol_dialog = None
+            self._symbol_choice.set("")
+    
+    def _ask_symbol_choice(self) -> Optional[str]:
+        dialog = self._symbol_dialog
+        if dialog is None:
+            return None
+        self._symbol_choice.set("")
+        dialog.deiconify()
+        dialog.grab_set()
+        
+        self.root.wait_variable(self._symbol_choice)
+        
+        if self._symbol_dialog is None:
+            # The window was closed while the dialog was open
+            return None
+        dialog.grab_release()
+        dialog.withdraw()
+        return self._symbol_choice.get() or None
+    
+    def _create_game_over_dialog(self) -> None:
+        # Built once and hidden; _show_game_over_dialog fills in the result and shows it
+        dialog = tk.Toplevel(self.root)
+        dialog.withdraw()
+        dialog.resizable(False, False)
+        dialog.transient(self.root)
+        
+        dialog.geometry(self._centered_geometry(350, 220))
+        dialog.protocol("WM_DELETE_WINDOW", lambda: self._answer_game_over(False))
+        # Same keys as messagebox.askyesno: Return answers yes, Escape answers no
+        dialog.bind("<Return>", lambda event: self._answer_game_over(True))
+        dialog.bind("<Escape>", lambda event: self._answer_game_over(False))
+        
+        self._game_over_label = tk.Label(
+            dialog,
+            text="",
+            font=("Arial", 13),
+            justify=tk.CENTER
+        )
+        self._game_over_label.pack(pady=20)
+        
+        button_frame = tk.Frame(dialog)
+        button_frame.pack(pady=10)
+        
+        for text, play_again in (("YES", True), ("NO", False)):
+            answer_button = tk.Button(
+                button_frame,
+                text=text,
+                font=("Arial", 14, "bold"),
+                width=8,
+                command=lambda answer=play_again: self._answer_game_over(answer)
+            )
+            answer_button.pack(side=tk.LEFT, padx=15)
+            if play_again:
+                self._game_over_yes_button = answer_button
+        
+        self._game_over_dialog = dialog
     
     def _reset_board_display(self) -> None:
-        for row in range(3):
-            for col in range(3):
-                self.buttons[row][col].config(
-                    text="",
-                    state=tk.NORMAL,
-                    bg=self.COLOR_BUTTON,
-                    fg=self.COLOR_TEXT
-                )
+        # The "cell" and "mark" tags address all nine items of a kind in one call
+        self.board_canvas.itemconfigure("cell", **self._EMPTY_CELL_STYLE)
+        self.board_canvas.itemconfigure("mark", text="")
+        self._board_dirty = False
     
-    def _disable_all_buttons(self) -> None:
-        for row in range(3):
-            for col in range(3):
-                self.buttons[row][col].config(state=tk.DISABLED)
+    def _disable_all_cells(self) -> None:
+        # Clicks after the game are already refused by the controller; just drop the hover
+        self.board_canvas.itemconfigure("cell", activefill="")
+        self._board_dirty = True
     
     def run(self) -> None:
         if self.root: